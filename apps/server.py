@@ -3,6 +3,7 @@
 
 import asyncio
 import os
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket
@@ -16,8 +17,22 @@ load_dotenv()
 
 CONFIG_PATH = os.getenv("APP_CONFIG", "config/dev.yaml")
 APP_CONFIG = load_app_config(CONFIG_PATH)
+DEFAULT_PROFILE = APP_CONFIG.profile(None)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Configure the serving event loop before connections are accepted."""
+
+    # Python 3.12+ can run new tasks eagerly up to their first suspension
+    # point, which skips a scheduling round-trip for short-lived tasks.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.websocket("/voice")
@@ -26,7 +41,7 @@ async def voice(websocket: WebSocket):
 
     await websocket.accept()
     profile_name = websocket.query_params.get("profile") if websocket.query_params else None
-    profile = APP_CONFIG.profile(profile_name)
+    profile = APP_CONFIG.profile(profile_name) if profile_name else DEFAULT_PROFILE
 
     serializer = ProtobufFrameSerializer()
     params = FastAPIWebsocketParams(
@@ -37,15 +52,29 @@ async def voice(websocket: WebSocket):
     transport = FastAPIWebsocketTransport(websocket, params)
 
     session = Session(transport, profile)
-    task = asyncio.create_task(session.start())
-
     try:
-        await task
+        await session.start()
     finally:
-        await session.stop()
+        # Shield teardown so a second cancellation cannot leave the runner half-stopped.
+        await asyncio.shield(session.stop())
 
 
 if __name__ == "__main__":
+    import importlib.util
+
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8765)
+    # uvloop and httptools are C-accelerated drop-ins for the default asyncio
+    # loop and h11 parser; fall back cleanly where they are not installed
+    # (uvloop has no Windows build).
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8765,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        ws="websockets",
+        # Frames are mostly PCM audio, which deflate cannot shrink; skip the
+        # per-message zlib pass in both directions.
+        ws_per_message_deflate=False,
+    )
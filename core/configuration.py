@@ -1,14 +1,19 @@
 """Profile and application configuration loading for the voice pipeline."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only ship the
+# pure-Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TransportConfig:
     """Transport-level configuration."""
 
@@ -16,7 +21,7 @@ class TransportConfig:
     session_timeout: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class STTConfig:
     """Speech-to-text settings."""
 
@@ -27,20 +32,26 @@ class STTConfig:
     dev_max_buffer_ms: int = 8000
     end_of_utterance_token: str = "<EOU>"
     sample_rate_hz: int = 16000
+    interim_coalesce_ms: int = 30
+    max_queued_audio_ms: int = 2000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """Language model settings."""
 
     host: str = "http://localhost:11434"
     persona_path: str = "config/persona_default.md"
-    min_vram_gb: int = 12
+    min_vram_gb: int = 10
+    os_vram_overhead_gb: float = 1.5
     model_override: Optional[str] = None
     tool_call_limit: int = 3
+    keep_alive: Optional[str] = "24h"
+    max_context_tokens: int = 8192
+    tool_call_filler: Optional[str] = "One moment."
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TTSConfig:
     """Text-to-speech settings."""
 
@@ -49,9 +60,10 @@ class TTSConfig:
     flush_on_punctuation: bool = True
     flush_char_threshold: int = 120
     sample_rate_hz: int = 24000
+    binary_audio: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProfileConfig:
     """Per-profile pipeline configuration."""
 
@@ -61,7 +73,7 @@ class ProfileConfig:
     tts: TTSConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Top-level configuration for the server and profiles."""
 
@@ -76,42 +88,42 @@ class AppConfig:
         return self.profiles[target]
 
 
+# Parsed configs keyed by resolved path, alongside the file mtime they were read at.
+_CONFIG_CACHE: Dict[Path, Tuple[int, "AppConfig"]] = {}
+
+
 def _load_yaml(path: Path) -> Mapping[str, Any]:
-    data = yaml.safe_load(path.read_text())
+    data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
     if not isinstance(data, Mapping):
         raise ValueError(f"Config at {path} must be a mapping")
     return data
 
 
-def _build_stt(config: Mapping[str, Any]) -> STTConfig:
-    return STTConfig(**config)
-
-
-def _build_llm(config: Mapping[str, Any]) -> LLMConfig:
-    return LLMConfig(**config)
-
-
-def _build_tts(config: Mapping[str, Any]) -> TTSConfig:
-    return TTSConfig(**config)
-
-
-def _build_transport(config: Mapping[str, Any]) -> TransportConfig:
-    return TransportConfig(**config)
+# Profile sections and the dataclass each YAML mapping is unpacked into.
+_PROFILE_SECTIONS = {"stt": STTConfig, "llm": LLMConfig, "tts": TTSConfig}
 
 
 def _build_profile(name: str, config: Mapping[str, Any]) -> ProfileConfig:
-    stt = _build_stt(config.get("stt", {}))
-    llm = _build_llm(config.get("llm", {}))
-    tts = _build_tts(config.get("tts", {}))
-    return ProfileConfig(name=name, stt=stt, llm=llm, tts=tts)
+    sections = {key: cls(**config.get(key, {})) for key, cls in _PROFILE_SECTIONS.items()}
+    # Interned so the per-connection ``profile.name != "prod"`` check compares pointers.
+    return ProfileConfig(name=sys.intern(name), **sections)
 
 
 def load_app_config(path: str | Path) -> AppConfig:
-    """Load the application configuration from YAML."""
+    """Load the application configuration from YAML.
+
+    Results are cached per file and reused until the file's mtime changes.
+    """
+
+    config_path = Path(path).resolve()
+    mtime_ns = config_path.stat().st_mtime_ns
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
 
-    config_map = _load_yaml(Path(path))
+    config_map = _load_yaml(config_path)
     default_profile = config_map.get("default_profile", "dev")
-    transport = _build_transport(config_map.get("transport", {}))
+    transport = TransportConfig(**config_map.get("transport", {}))
 
     profiles: Dict[str, ProfileConfig] = {}
     for name, profile_cfg in config_map.get("profiles", {}).items():
@@ -120,4 +132,6 @@ def load_app_config(path: str | Path) -> AppConfig:
     if not profiles:
         raise ValueError("No profiles defined in configuration file")
 
-    return AppConfig(default_profile=default_profile, transport=transport, profiles=profiles)
+    app_config = AppConfig(default_profile=default_profile, transport=transport, profiles=profiles)
+    _CONFIG_CACHE[config_path] = (mtime_ns, app_config)
+    return app_config
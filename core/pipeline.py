@@ -1,7 +1,10 @@
 """Voice agent pipeline wiring for Local-Call."""
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
 
 from pipecat.frames.frames import (
     BotInterruptionFrame,
@@ -24,6 +27,8 @@ from tools.registry import create_default_registry
 from tts.vibevoice_adapter import VibeVoiceAdapter
 from tts.vibevoice_service import VibeVoiceService
 
+_FrameHandler = Callable[["BargeInController"], Awaitable[None]]
+
 
 class BargeInController(FrameProcessor):
     """Emit interruption frames when the user speaks over the assistant."""
@@ -33,20 +38,45 @@ class BargeInController(FrameProcessor):
         self._assistant_speaking = False
 
     async def process_frame(self, frame, direction: FrameDirection):
-        if isinstance(frame, BotStartedSpeakingFrame):
-            self._assistant_speaking = True
-        elif isinstance(frame, (BotStoppedSpeakingFrame, BotInterruptionFrame, InterruptionFrame)):
-            self._assistant_speaking = False
+        handler = self._handler_for(type(frame))
+        if handler is not None:
+            await handler(self)
 
-        if isinstance(frame, CancelFrame):
-            self._assistant_speaking = False
+        await self.push_frame(frame, direction)
+
+    async def _mark_speaking(self) -> None:
+        self._assistant_speaking = True
+
+    async def _clear_speaking(self) -> None:
+        self._assistant_speaking = False
 
-        if isinstance(frame, InputAudioRawFrame) and self._assistant_speaking:
+    async def _maybe_interrupt(self) -> None:
+        if self._assistant_speaking:
             # Interrupt downstream processors before letting the new audio through.
             await self.push_frame(InterruptionFrame(), FrameDirection.DOWNSTREAM)
             self._assistant_speaking = False
 
-        await self.push_frame(frame, direction)
+    _HANDLERS: Dict[type, _FrameHandler] = {
+        BotStartedSpeakingFrame: _mark_speaking,
+        BotStoppedSpeakingFrame: _clear_speaking,
+        BotInterruptionFrame: _clear_speaking,
+        InterruptionFrame: _clear_speaking,
+        CancelFrame: _clear_speaking,
+        InputAudioRawFrame: _maybe_interrupt,
+    }
+    # Handlers resolved per concrete frame type, so subclasses such as
+    # UserAudioRawFrame only walk their MRO once.
+    _RESOLVED_HANDLERS: Dict[type, Optional[_FrameHandler]] = {}
+
+    @classmethod
+    def _handler_for(cls, frame_type: type) -> Optional[_FrameHandler]:
+        try:
+            return cls._RESOLVED_HANDLERS[frame_type]
+        except KeyError:
+            pass
+        handler = next((cls._HANDLERS[base] for base in frame_type.__mro__ if base in cls._HANDLERS), None)
+        cls._RESOLVED_HANDLERS[frame_type] = handler
+        return handler
 
 
 class ContextFrames:
@@ -62,9 +92,35 @@ class ContextFrames:
         return self._transcript.assistant()
 
 
+@dataclass(frozen=True)
+class StatelessStack:
+    """Pipeline components that are safe to share between sessions."""
+
+    model_router: ModelRouter
+
+
+@functools.lru_cache(maxsize=16)
+def build_stateless_stack(profile: ProfileConfig) -> StatelessStack:
+    """Build (once per profile) the components that hold no connection state."""
+
+    model_router = ModelRouter(
+        persona_path=Path(profile.llm.persona_path),
+        min_vram_gb=profile.llm.min_vram_gb,
+        os_vram_overhead_gb=profile.llm.os_vram_overhead_gb,
+        override_model=profile.llm.model_override,
+    )
+    return StatelessStack(model_router=model_router)
+
+
 def create_pipeline(profile: ProfileConfig, transport) -> Pipeline:
     """Create a configured pipeline for the given profile and transport."""
 
+    return wire_pipeline(build_stateless_stack(profile), profile, transport)
+
+
+def wire_pipeline(stack: StatelessStack, profile: ProfileConfig, transport) -> Pipeline:
+    """Compose shared components with fresh per-connection processors."""
+
     dev_mode = profile.name != "prod"
 
     parakeet_service = ParakeetService(
@@ -74,6 +130,7 @@ def create_pipeline(profile: ProfileConfig, transport) -> Pipeline:
         dev_mode=dev_mode,
         dev_buffer_ms=profile.stt.dev_buffer_ms,
         max_buffer_ms=profile.stt.dev_max_buffer_ms,
+        max_queued_audio_ms=profile.stt.max_queued_audio_ms,
         initial_prompt=profile.stt.prepend_prompt or None,
     )
 
@@ -81,29 +138,31 @@ def create_pipeline(profile: ProfileConfig, transport) -> Pipeline:
         parakeet_service,
         prepend_prompt=profile.stt.prepend_prompt,
         append_prompt=profile.stt.append_prompt,
+        interim_coalesce_ms=profile.stt.interim_coalesce_ms,
     )
 
-    model_router = ModelRouter(
-        persona_path=Path(profile.llm.persona_path),
-        min_vram_gb=profile.llm.min_vram_gb,
-        override_model=profile.llm.model_override,
-    )
-    system_prompt = model_router.load_persona()
+    # The tool registry holds per-session memory, so it is never shared.
     tool_registry = create_default_registry()
 
     llm_client = OllamaClient(
-        model_router=model_router,
+        model_router=stack.model_router,
         tool_registry=tool_registry,
         profile=profile.name,
-        system_prompt=system_prompt,
+        # Read per connection so persona edits apply without a restart; an
+        # unchanged file costs one stat() thanks to the mtime-keyed cache.
+        system_prompt=stack.model_router.load_persona(),
         host=profile.llm.host,
         tool_call_limit=profile.llm.tool_call_limit,
+        keep_alive=profile.llm.keep_alive,
+        max_context_tokens=profile.llm.max_context_tokens,
+        tool_call_filler=profile.llm.tool_call_filler,
     )
 
     vibevoice_service = VibeVoiceService(
         server_uri=profile.tts.server_uri,
         voice=profile.tts.voice,
         dev_mode=dev_mode,
+        binary_audio=profile.tts.binary_audio,
     )
     tts_adapter = VibeVoiceAdapter(
         vibevoice_service,
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
 from pipecat.pipeline.runner import PipelineRunner
@@ -31,7 +32,17 @@ class Session:
     async def stop(self):
         """Stop the pipeline and clean up resources."""
 
-        if self.runner:
-            await self.runner.cancel()
+        runner = self.runner
+        if runner is None:
+            return
+        # Clear state first so repeated stop() calls are no-ops.
         self.runner = None
         self.pipeline_task = None
+        try:
+            await runner.cancel()
+        except asyncio.CancelledError:
+            # Tolerate the pipeline's own cancellation surfacing here, but never
+            # swallow a cancellation aimed at the task calling stop().
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
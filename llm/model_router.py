@@ -1,65 +1,150 @@
 """Model selection utilities for Ollama-backed chat models."""
 from __future__ import annotations
 
+import atexit
+import functools
 import importlib
 import os
 import subprocess
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
 DEFAULT_QWEN = "qwen3:14b"
 DEFAULT_GEMMA = "gemma2:2b"
 DEFAULT_PERSONA_PATH = Path("config/persona_default.md")
 
+_nvml_initialised = False
+
+_GPU_DEVICE_NODES = ("/dev/nvidiactl", "/dev/dxg")
+
+# Persona text keyed by resolved path, alongside the file mtime it was read at.
+_PERSONA_CACHE: Dict[Path, Tuple[int, str]] = {}
+
+# Run in a child interpreter so the CUDA context torch creates is torn down
+# with the process instead of pinning VRAM in the server for its lifetime.
+_TORCH_PROBE = (
+    "import torch\n"
+    "if torch.cuda.is_available():\n"
+    "    free, total = torch.cuda.mem_get_info(0)\n"
+    "    print(total, free)\n"
+)
+
+
+@dataclass(frozen=True)
+class GPUMemory:
+    """Total and currently free memory of a GPU, in GiB."""
+
+    total_gb: float
+    free_gb: float
+
+    @classmethod
+    def from_bytes(cls, total: int, free: int) -> "GPUMemory":
+        return cls(total_gb=total / 1024**3, free_gb=free / 1024**3)
+
 
 @dataclass
 class ModelRouter:
     """Choose an Ollama model based on runtime profile and GPU memory."""
 
     persona_path: Path = DEFAULT_PERSONA_PATH
-    min_vram_gb: int = 12
+    # VRAM Qwen occupies once loaded (4-bit Qwen3-14B weights plus KV cache).
+    min_vram_gb: int = 10
+    # Free VRAM held back on top of that, like Ollama's OLLAMA_GPU_OVERHEAD.
+    os_vram_overhead_gb: float = 1.5
     override_model: Optional[str] = None
 
-    def select_model(self, profile: str) -> str:
-        if self.override_model:
-            return self.override_model
+    def select_model(self, profile: str, *, reclaimable_gb: float = 0.0) -> str:
+        """Pick the model for ``profile`` from a fresh reading of free VRAM.
+
+        ``reclaimable_gb`` is VRAM that counts as free because it is held by
+        a model Ollama would swap out, e.g. Qwen kept resident by keep_alive.
+        Callers choose once per session so a conversation never switches model.
+        """
 
-        if profile == "prod":
-            return self._prod_model()
+        forced_model = self.override_model or os.environ.get("LOCAL_CALL_FORCE_MODEL")
+        if forced_model:
+            return forced_model
 
-        return self._dev_model()
+        # Dev and prod share the same VRAM rule.
+        return self._select_by_vram(reclaimable_gb)
+
+    def invalidate(self) -> None:
+        """Re-discover how to probe the GPU on next use."""
+
+        _gpu_probe.cache_clear()
 
     def load_persona(self) -> str:
-        return self.persona_path.read_text(encoding="utf-8").strip()
+        return _read_persona(Path(self.persona_path))
 
-    def _prod_model(self) -> str:
-        vram_gb = _detect_gpu_vram_gb()
-        if vram_gb is not None and vram_gb >= self.min_vram_gb:
-            return DEFAULT_QWEN
-        return DEFAULT_GEMMA
+    def invalidate_persona(self) -> None:
+        """Force the persona file to be re-read on next use."""
+
+        _PERSONA_CACHE.pop(Path(self.persona_path).resolve(), None)
 
-    def _dev_model(self) -> str:
-        vram_gb = _detect_gpu_vram_gb()
-        if vram_gb is not None and vram_gb >= self.min_vram_gb:
+    def _select_by_vram(self, reclaimable_gb: float = 0.0) -> str:
+        memory = _detect_gpu_memory()
+        if memory is None:
+            return DEFAULT_GEMMA
+        available_gb = memory.free_gb + reclaimable_gb - self.os_vram_overhead_gb
+        if available_gb >= self.min_vram_gb:
             return DEFAULT_QWEN
         return DEFAULT_GEMMA
 
 
-def _detect_gpu_vram_gb() -> Optional[int]:
-    """Return the total VRAM of the first GPU in GiB, if available."""
+def _read_persona(path: Path) -> str:
+    """Read a persona file, re-reading it only when its mtime changes."""
+
+    persona_path = path.resolve()
+    mtime_ns = persona_path.stat().st_mtime_ns
+    cached = _PERSONA_CACHE.get(persona_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    persona = persona_path.read_text(encoding="utf-8").strip()
+    _PERSONA_CACHE[persona_path] = (mtime_ns, persona)
+    return persona
+
+
+def _detect_gpu_memory() -> Optional[GPUMemory]:
+    """Return a fresh reading of total and free memory of the first GPU.
+
+    Free memory changes as Ollama loads and unloads models, so only the
+    choice of probe is cached; each call takes a new reading from it.
+    """
+
+    probe = _gpu_probe()
+    return probe() if probe is not None else None
+
+
+@functools.lru_cache(maxsize=1)
+def _gpu_probe() -> Optional[Callable[[], Optional[GPUMemory]]]:
+    """Find the cheapest working GPU memory probe, once per process."""
+
+    if _gpu_ruled_out():
+        return None
 
+    probes = []
+    if importlib.util.find_spec("pynvml"):
+        probes.append(_nvml_memory)
+    probes.append(_nvidia_smi_memory)
     if importlib.util.find_spec("torch"):
-        import torch
+        probes.append(_torch_memory)
 
-        if torch.cuda.is_available():
-            total_bytes = torch.cuda.get_device_properties(0).total_memory
-            return int(total_bytes // (1024**3))
+    for probe in probes:
+        if probe() is not None:
+            return probe
+    return None
+
+
+def _nvidia_smi_memory() -> Optional[GPUMemory]:
+    """Query memory of GPU 0 through ``nvidia-smi``."""
 
     nvidia_smi = os.environ.get("NVIDIA_SMI", "nvidia-smi")
     try:
         output = subprocess.check_output(
-            [nvidia_smi, "--query-gpu=memory.total", "--format=csv,noheader,nounits"],
+            [nvidia_smi, "--query-gpu=memory.total,memory.free", "--format=csv,noheader,nounits"],
             stderr=subprocess.DEVNULL,
             text=True,
             timeout=2,
@@ -70,7 +155,58 @@ def _detect_gpu_vram_gb() -> Optional[int]:
     if not output:
         return None
 
-    first_line = output.splitlines()[0].strip()
-    if first_line.isdigit():
-        return int(first_line) // 1024 if int(first_line) > 0 else None
+    # nvidia-smi reports MiB.
+    fields = [part.strip() for part in output.splitlines()[0].split(",")]
+    if len(fields) == 2 and all(part.isdigit() for part in fields) and int(fields[0]) > 0:
+        return GPUMemory(total_gb=int(fields[0]) / 1024, free_gb=int(fields[1]) / 1024)
+    return None
+
+
+def _gpu_ruled_out() -> bool:
+    """Cheap checks that rule out an NVIDIA GPU before any expensive probing."""
+
+    if os.environ.get("CUDA_VISIBLE_DEVICES") == "":
+        return True
+    if not sys.platform.startswith("linux"):
+        return False
+    # Native drivers (and GPU containers) expose /dev/nvidiactl; WSL2 and
+    # Docker Desktop route the GPU through /dev/dxg instead.
+    return not any(os.path.exists(device) for device in _GPU_DEVICE_NODES)
+
+
+def _nvml_memory() -> Optional[GPUMemory]:
+    """Query memory of GPU 0 through NVML, without spawning a process."""
+
+    global _nvml_initialised
+    import pynvml
+
+    try:
+        if not _nvml_initialised:
+            pynvml.nvmlInit()
+            atexit.register(pynvml.nvmlShutdown)
+            _nvml_initialised = True
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+    except pynvml.NVMLError:
+        return None
+    return GPUMemory.from_bytes(int(info.total), int(info.free))
+
+
+def _torch_memory() -> Optional[GPUMemory]:
+    """Query memory of GPU 0 through torch in a short-lived subprocess."""
+
+    try:
+        output = subprocess.check_output(
+            [sys.executable, "-c", _TORCH_PROBE],
+            stderr=subprocess.DEVNULL,
+            text=True,
+            # Importing torch alone can take several seconds on a cold cache.
+            timeout=30,
+        ).strip()
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+    fields = output.split()
+    if len(fields) == 2 and all(part.isdigit() for part in fields):
+        return GPUMemory.from_bytes(int(fields[0]), int(fields[1]))
     return None
@@ -2,18 +2,30 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import contextlib
+import io
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Mapping, Optional, Sequence
 
 from ollama import AsyncClient
-from pipecat.frames.frames import Frame, InterruptionFrame, TextFrame
+from pipecat.frames.frames import Frame, InterruptionFrame, StartFrame, TextFrame
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
 from llm.model_router import ModelRouter
 from stt.parakeet_adapter import EndOfUtteranceFrame
 from tools.registry import ToolRegistry
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
+
+# Deltas are coalesced into one TextFrame per phrase so downstream
+# processors see a few frames per sentence rather than one per token.
+_PHRASE_BOUNDARIES = frozenset(".?!,\n")
+_MAX_PENDING_CHARS = 32
+
 
 class OllamaClient(FrameProcessor):
     """Stream chat completions from Ollama and handle OpenAI-style tool calls."""
@@ -27,27 +39,36 @@ class OllamaClient(FrameProcessor):
         system_prompt: Optional[str] = None,
         host: str = "http://localhost:11434",
         tool_call_limit: int = 3,
+        keep_alive: Optional[str] = "24h",
+        max_context_tokens: int = 8192,
+        tool_call_filler: Optional[str] = "One moment.",
     ) -> None:
         super().__init__()
         self._model_router = model_router
         self._tool_registry = tool_registry
+        self._model: Optional[str] = None
         self._profile = profile
         self._tool_call_limit = tool_call_limit
+        self._keep_alive = keep_alive
+        self._max_context_tokens = max_context_tokens
+        self._tool_call_filler = tool_call_filler
         self._client = AsyncClient(host=host)
-        self._messages: List[Dict[str, Any]] = []
+        self._messages: Deque[Dict[str, Any]] = collections.deque()
+        self._history_tokens = 0
         if system_prompt:
-            self._messages.append({"role": "system", "content": system_prompt})
-        self._pending_user: List[str] = []
+            self._append_message({"role": "system", "content": system_prompt})
+        self._pending_user = io.StringIO()
         self._generation_task: Optional[asyncio.Task[None]] = None
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         if isinstance(frame, TextFrame):
-            self._pending_user.append(frame.text)
+            self._pending_user.write(frame.text)
+            self._pending_user.write(" ")
             return
 
         if isinstance(frame, EndOfUtteranceFrame):
-            text = " ".join(self._pending_user).strip()
-            self._pending_user.clear()
+            text = self._pending_user.getvalue().strip()
+            self._pending_user = io.StringIO()
             if text:
                 await self._cancel_generation()
                 self._generation_task = self.create_task(self._handle_user_turn(text))
@@ -57,15 +78,89 @@ class OllamaClient(FrameProcessor):
             await self._cancel_generation()
             return
 
+        if isinstance(frame, StartFrame):
+            # Load the model while the user is still speaking their first turn.
+            self.create_task(self._warm_up())
+
         await self.push_frame(frame, direction)
 
+    async def _session_model(self) -> str:
+        # Chosen once per session from a fresh VRAM reading, then kept so a
+        # conversation never switches model between turns.
+        if self._model is None:
+            reclaimable_gb = await self._resident_vram_gb()
+            # GPU probing can spawn nvidia-smi or a torch child process; keep it
+            # off the event loop so other sessions are not stalled.
+            model = await asyncio.to_thread(
+                self._model_router.select_model, self._profile, reclaimable_gb=reclaimable_gb
+            )
+            if self._model is None:  # warm-up and the first turn may race
+                self._model = model
+        return self._model
+
+    async def _resident_vram_gb(self) -> float:
+        """VRAM held by models Ollama has loaded, which it frees to load ours."""
+
+        try:
+            response = await self._client.ps()
+        except Exception:  # pragma: no cover - Ollama unreachable; treat as nothing loaded
+            return 0.0
+        return sum(model.size_vram or 0 for model in response.models) / 1024**3
+
+    async def _warm_up(self):
+        """Ask Ollama to load the session model and keep it resident between turns."""
+
+        model = await self._session_model()
+        try:
+            await self._client.generate(model=model, prompt="", keep_alive=self._keep_alive)
+        except Exception:  # pragma: no cover - best effort; the first turn loads it anyway
+            pass
+
     async def _handle_user_turn(self, text: str):
-        self._messages.append({"role": "user", "content": text})
+        self._append_message({"role": "user", "content": text})
+        self._trim_history()
         await self._run_chat_with_tools(depth=0)
 
+    def _append_message(self, message: Dict[str, Any]):
+        self._messages.append(message)
+        self._history_tokens += self._estimate_tokens(message)
+
+    @staticmethod
+    def _estimate_tokens(message: Dict[str, Any]) -> int:
+        # Rough heuristic of ~4 characters per token; tool call payloads count too.
+        size = len(str(message.get("content") or ""))
+        if message.get("tool_calls"):
+            size += len(str(message["tool_calls"]))
+        return size // 4
+
+    def _trim_history(self):
+        """Drop the oldest turns until the history fits ``max_context_tokens``.
+
+        Whole turns are removed (a user message through to the next one) so
+        tool calls are never separated from their results.  The system prompt
+        and the latest turn are always kept.
+        """
+
+        if self._history_tokens <= self._max_context_tokens:
+            return
+
+        system = self._messages.popleft() if self._messages[0]["role"] == "system" else None
+        while self._history_tokens > self._max_context_tokens:
+            next_turn = next(
+                (index for index, message in enumerate(self._messages) if index and message["role"] == "user"),
+                None,
+            )
+            if next_turn is None:
+                break
+            for _ in range(next_turn):
+                self._history_tokens -= self._estimate_tokens(self._messages.popleft())
+        if system is not None:
+            self._messages.appendleft(system)
+
     async def _run_chat_with_tools(self, *, depth: int):
-        model = self._model_router.select_model(self._profile)
-        tools = self._tool_registry.tool_schemas()
+        model = await self._session_model()
+        # The registry caches its schemas, so reading them per request is cheap.
+        tools = self._tool_registry.tool_schemas() or None
         tool_calls, assistant_content = await self._stream_completion(model, tools)
         if tool_calls:
             assistant_message = {
@@ -73,68 +168,97 @@ class OllamaClient(FrameProcessor):
                 "content": assistant_content,
                 "tool_calls": tool_calls,
             }
-            self._messages.append(assistant_message)
+            self._append_message(assistant_message)
             if depth >= self._tool_call_limit:
                 await self.push_frame(
                     TextFrame("I'm unable to complete further tool calls right now."),
                     FrameDirection.DOWNSTREAM,
                 )
                 return
+            if depth == 0 and not assistant_content and self._tool_call_filler:
+                # Tool-call responses often arrive as one chunk with no text;
+                # say something so TTS is not silent while the tools run.
+                await self._push_text([self._tool_call_filler])
             await self._process_tool_calls(tool_calls)
             await self._run_chat_with_tools(depth=depth + 1)
         elif assistant_content:
-            self._messages.append({"role": "assistant", "content": assistant_content})
+            self._append_message({"role": "assistant", "content": assistant_content})
 
-    async def _stream_completion(self, model: str, tools: List[Dict[str, Any]]):
+    async def _stream_completion(self, model: str, tools: Optional[Sequence[Dict[str, Any]]]):
         tool_calls: List[Dict[str, Any]] = []
         content_fragments: List[str] = []
+        pending_start = 0
+        pending_len = 0
         try:
             async for chunk in self._client.chat(
                 model=model,
                 messages=self._messages,
-                tools=tools if tools else None,
+                tools=tools,
                 stream=True,
+                keep_alive=self._keep_alive,
             ):
                 message = chunk.get("message", {})
                 delta = message.get("content")
                 if delta:
                     content_fragments.append(delta)
-                    await self.push_frame(TextFrame(delta), FrameDirection.DOWNSTREAM)
+                    pending_len += len(delta)
+                    if pending_len >= _MAX_PENDING_CHARS or delta.rstrip(" ")[-1:] in _PHRASE_BOUNDARIES:
+                        await self._push_text(content_fragments[pending_start:])
+                        pending_start = len(content_fragments)
+                        pending_len = 0
                 chunk_tool_calls = message.get("tool_calls") or []
                 if chunk_tool_calls:
                     tool_calls.extend(chunk_tool_calls)
         except asyncio.CancelledError:
             raise
+        if pending_len:
+            await self._push_text(content_fragments[pending_start:])
         assistant_content = "".join(content_fragments).strip()
         return tool_calls, assistant_content
 
+    async def _push_text(self, fragments: List[str]):
+        await self.push_frame(TextFrame("".join(fragments)), FrameDirection.DOWNSTREAM)
+
     async def _process_tool_calls(self, tool_calls: List[Dict[str, Any]]):
+        # Tool calls within one response are independent, so run them together
+        # and append the results in the order the model requested them.
+        invocations = []
         for call in tool_calls:
             function = call.get("function", {})
-            name = function.get("name")
-            raw_arguments = function.get("arguments", "{}")
-            args = self._safe_json_loads(raw_arguments)
-            result = await self._tool_registry.invoke(name or "", args)
+            args = self._safe_json_loads(function.get("arguments", "{}"))
+            invocations.append(self._tool_registry.invoke(function.get("name") or "", args))
+        results = await asyncio.gather(*invocations, return_exceptions=True)
+
+        for call, result in zip(tool_calls, results):
+            name = call.get("function", {}).get("name")
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                result = f"Tool {name} failed: {result}"
             tool_message: Dict[str, Any] = {
                 "role": "tool",
                 "tool_call_id": call.get("id"),
                 "name": name,
                 "content": result,
             }
-            self._messages.append(tool_message)
+            self._append_message(tool_message)
 
     @staticmethod
-    def _safe_json_loads(payload: str) -> Dict[str, Any]:
+    def _safe_json_loads(payload: Any) -> Dict[str, Any]:
+        # The ollama client may already hand back parsed argument mappings.
+        if isinstance(payload, Mapping):
+            return dict(payload)
         try:
-            loaded = json.loads(payload)
+            loaded = _json_loads(payload)
             if isinstance(loaded, dict):
                 return loaded
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, TypeError):
             pass
         return {}
 
     async def aclose(self):
         await self._client.close()
+        await self._tool_registry.aclose()
 
     async def cleanup(self):
         await self._cancel_generation()
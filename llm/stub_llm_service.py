@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from pipecat.frames.frames import TextFrame
 from pipecat.processors.frame_processor import FrameDirection
@@ -46,6 +46,8 @@ class StubLLMService(OllamaClient):
         system_prompt: Optional[str] = None,
         token_delay: float = 0.0,
         tool_call_limit: int = 3,
+        max_context_tokens: int = 8192,
+        tool_call_filler: Optional[str] = "One moment.",
     ) -> None:
         prompt = system_prompt if system_prompt is not None else model_router.load_persona()
         super().__init__(
@@ -55,11 +57,19 @@ class StubLLMService(OllamaClient):
             system_prompt=prompt,
             host="http://localhost:0",  # Unused; no real network calls in the stub
             tool_call_limit=tool_call_limit,
+            max_context_tokens=max_context_tokens,
+            tool_call_filler=tool_call_filler,
         )
         self._responses: Iterator[StubResponse] = iter(responses)
         self._token_delay = token_delay
 
-    async def _stream_completion(self, model: str, tools: List[Dict[str, Any]]):  # type: ignore[override]
+    async def _warm_up(self):
+        return None
+
+    async def _resident_vram_gb(self) -> float:
+        return 0.0
+
+    async def _stream_completion(self, model: str, tools: Optional[Sequence[Dict[str, Any]]]):  # type: ignore[override]
         try:
             response = next(self._responses)
         except StopIteration:
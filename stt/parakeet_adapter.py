@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 import asyncio
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, List, Optional
 
-from pipecat.frames.frames import Frame, InputAudioRawFrame, TranscriptionFrame
+from pipecat.frames.frames import EndFrame, Frame, InputAudioRawFrame, TranscriptionFrame
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.utils.time import time_now_iso8601
 
-from stt.parakeet_service import ParakeetService
+from stt.parakeet_service import ParakeetService, TranscriptSegment
 
 
 class EndOfUtteranceFrame(Frame):
@@ -24,11 +24,16 @@ class ParakeetSTTAdapter(FrameProcessor):
         *,
         prepend_prompt: str = "",
         append_prompt: str = "",
+        interim_coalesce_ms: int = 30,
     ) -> None:
         super().__init__()
         self._service = service
         self._prepend_prompt = prepend_prompt
         self._append_prompt = append_prompt
+        self._coalesce_window = interim_coalesce_ms / 1000
+        # Unbounded: pipecat delivers audio frames back-to-back without yielding,
+        # so this queue briefly holds bursts. The cap lives at the recogniser
+        # hand-off in ParakeetService, where it is sized in audio time.
         self._audio_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
         self._transcribe_task: Optional[asyncio.Task[None]] = None
 
@@ -40,19 +45,58 @@ class ParakeetSTTAdapter(FrameProcessor):
             yield chunk
 
     async def _drain_transcripts(self):
-        async for segment in self._service.stream_transcription(self._audio_generator()):
-            if not segment.text:
-                continue
-            text = f"{self._prepend_prompt}{segment.text}{self._append_prompt}".strip()
-            transcript = TranscriptionFrame(
-                text=text,
-                user_id="anonymous",
-                timestamp=time_now_iso8601(),
-                result=segment,
-            )
-            await self.push_frame(transcript, FrameDirection.DOWNSTREAM)
-            if segment.end_of_utterance:
-                await self.push_frame(EndOfUtteranceFrame(), FrameDirection.DOWNSTREAM)
+        # Interim segments arriving within the coalescing window are merged into
+        # one frame; final and end-of-utterance segments flush immediately.
+        loop = asyncio.get_running_loop()
+        segments = self._service.stream_transcription(self._audio_generator()).__aiter__()
+        pending: List[TranscriptSegment] = []
+        flush_at = 0.0
+        # The in-flight read is kept across timeouts; cancelling it would close the stream.
+        next_segment: Optional[asyncio.Future[TranscriptSegment]] = None
+        try:
+            while True:
+                if next_segment is None:
+                    next_segment = asyncio.ensure_future(segments.__anext__())
+                timeout = max(0.0, flush_at - loop.time()) if pending else None
+                done, _ = await asyncio.wait({next_segment}, timeout=timeout)
+                if not done:
+                    await self._push_transcript(pending)
+                    pending = []
+                    continue
+
+                finished, next_segment = next_segment, None
+                try:
+                    segment = finished.result()
+                except StopAsyncIteration:
+                    break
+                if not segment.text:
+                    continue
+                if not pending:
+                    flush_at = loop.time() + self._coalesce_window
+                pending.append(segment)
+                if segment.is_final or segment.end_of_utterance or self._coalesce_window <= 0:
+                    await self._push_transcript(pending)
+                    pending = []
+
+            if pending:
+                await self._push_transcript(pending)
+        finally:
+            if next_segment is not None:
+                next_segment.cancel()
+
+    async def _push_transcript(self, segments: List[TranscriptSegment]):
+        last = segments[-1]
+        merged = " ".join(segment.text for segment in segments)
+        text = f"{self._prepend_prompt}{merged}{self._append_prompt}".strip()
+        transcript = TranscriptionFrame(
+            text=text,
+            user_id="anonymous",
+            timestamp=time_now_iso8601(),
+            result=last,
+        )
+        await self.push_frame(transcript, FrameDirection.DOWNSTREAM)
+        if last.end_of_utterance:
+            await self.push_frame(EndOfUtteranceFrame(), FrameDirection.DOWNSTREAM)
 
     async def _ensure_transcriber(self):
         if not self._transcribe_task or self._transcribe_task.done():
@@ -67,11 +111,11 @@ class ParakeetSTTAdapter(FrameProcessor):
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         if isinstance(frame, InputAudioRawFrame):
             await self._ensure_transcriber()
-            await self._audio_queue.put(frame.audio)
+            self._audio_queue.put_nowait(frame.audio)
         else:
             # Pass through non-audio frames untouched.
             await self.push_frame(frame, direction)
 
         # If the upstream signals a stop (common for EndFrame), close the stream.
-        if frame.__class__.__name__ == "EndFrame":
+        if isinstance(frame, EndFrame):
             await self._stop_transcriber()
@@ -16,10 +16,12 @@ real-time streaming is unrealistic).
 from __future__ import annotations
 
 import asyncio
-import queue
+import collections
+import functools
+import re
 import threading
 from dataclasses import dataclass
-from typing import AsyncIterator, Iterator, List, Optional
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 
 
 @dataclass
@@ -31,6 +33,68 @@ class TranscriptSegment:
     end_of_utterance: bool = False
 
 
+@functools.lru_cache(maxsize=None)
+def _token_pattern(token: str) -> re.Pattern[str]:
+    return re.compile(re.escape(token))
+
+
+def split_end_of_utterance(text: str, token: str) -> Tuple[str, bool]:
+    """Strip ``token`` from ``text`` and report whether it was present."""
+
+    if not token:
+        return text, False
+    # One scan both detects and strips the token.
+    cleaned, count = _token_pattern(token).subn("", text)
+    if not count:
+        return text, False
+    return cleaned.strip(), True
+
+
+class _AudioHandoff:
+    """Thread-safe FIFO of PCM chunks capped at ``max_bytes``.
+
+    When the recogniser falls behind by more than the cap, the oldest audio
+    is dropped so transcription stays close to real time.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._chunks: collections.deque[bytes] = collections.deque()
+        self._bytes = 0
+        self._closed = False
+        self._ready = threading.Condition()
+
+    def put(self, chunk: bytes) -> int:
+        """Queue ``chunk`` and return how many bytes were dropped to fit it."""
+
+        dropped = 0
+        with self._ready:
+            self._chunks.append(chunk)
+            self._bytes += len(chunk)
+            while self._bytes > self._max_bytes and len(self._chunks) > 1:
+                oldest = self._chunks.popleft()
+                self._bytes -= len(oldest)
+                dropped += len(oldest)
+            self._ready.notify()
+        return dropped
+
+    def close(self):
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            with self._ready:
+                while not self._chunks and not self._closed:
+                    self._ready.wait()
+                if not self._chunks:
+                    return
+                chunk = self._chunks.popleft()
+                self._bytes -= len(chunk)
+            yield chunk
+
+
 class ParakeetService:
     """Wrapper around the Parakeet ASR model served via Riva."""
 
@@ -49,6 +113,7 @@ class ParakeetService:
         dev_mode: bool = False,
         dev_buffer_ms: int = 2000,
         max_buffer_ms: int = 8000,
+        max_queued_audio_ms: int = 2000,
     ) -> None:
         self._server_uri = server_uri
         self._use_ssl = use_ssl
@@ -62,6 +127,11 @@ class ParakeetService:
         self._dev_mode = dev_mode
         self._dev_buffer_ms = dev_buffer_ms
         self._max_buffer_ms = max_buffer_ms
+        # Buffered decode flushes at whichever window is smaller, expressed in
+        # bytes of 16-bit PCM (two bytes per sample).
+        self._flush_bytes = min(dev_buffer_ms, max_buffer_ms) * sample_rate_hz * 2 // 1000
+        self._max_queued_bytes = max_queued_audio_ms * sample_rate_hz * 2 // 1000
+        self.dropped_audio_bytes = 0
 
         self._auth = None
         self._asr_service = None
@@ -121,10 +191,7 @@ class ParakeetService:
                 continue
             alternative = result.alternatives[0]
             text = getattr(alternative, "transcript", "")
-            end_of_utterance = False
-            if self._end_of_utterance_token and self._end_of_utterance_token in text:
-                end_of_utterance = True
-                text = text.replace(self._end_of_utterance_token, "").strip()
+            text, end_of_utterance = split_end_of_utterance(text, self._end_of_utterance_token)
             yield TranscriptSegment(text=text, is_final=getattr(result, "is_final", False) or end_of_utterance, end_of_utterance=end_of_utterance)
 
     def _stream_with_riva(
@@ -152,14 +219,17 @@ class ParakeetService:
 
     async def _run_streaming(self, audio_stream: AsyncIterator[bytes]) -> AsyncIterator[TranscriptSegment]:
         loop = asyncio.get_running_loop()
-        audio_queue: queue.Queue[Optional[bytes]] = queue.Queue()
+        # Bounded in audio time, so a stalled Riva stream cannot grow memory.
+        audio_queue = _AudioHandoff(self._max_queued_bytes)
         segment_queue: asyncio.Queue[Optional[TranscriptSegment]] = asyncio.Queue()
-        done_sending = threading.Event()
 
         async def forward_audio():
-            async for chunk in audio_stream:
-                audio_queue.put(chunk)
-            done_sending.set()
+            try:
+                async for chunk in audio_stream:
+                    self.dropped_audio_bytes += audio_queue.put(chunk)
+            finally:
+                # Always close, even on cancellation, so the worker never hangs.
+                audio_queue.close()
 
         async def forward_segments():
             while True:
@@ -168,22 +238,12 @@ class ParakeetService:
                     break
                 yield segment
 
-        def audio_generator():
-            while not (done_sending.is_set() and audio_queue.empty()):
-                try:
-                    chunk = audio_queue.get(timeout=0.05)
-                except queue.Empty:
-                    continue
-                if chunk is None:
-                    break
-                yield chunk
-
         def worker():
             try:
-                for segment in self._stream_with_riva(audio_generator()):
-                    asyncio.run_coroutine_threadsafe(segment_queue.put(segment), loop)
+                for segment in self._stream_with_riva(iter(audio_queue)):
+                    loop.call_soon_threadsafe(segment_queue.put_nowait, segment)
             finally:
-                asyncio.run_coroutine_threadsafe(segment_queue.put(None), loop)
+                loop.call_soon_threadsafe(segment_queue.put_nowait, None)
 
         audio_task = asyncio.create_task(forward_audio())
         thread = threading.Thread(target=worker, daemon=True)
@@ -196,25 +256,32 @@ class ParakeetService:
         thread.join()
 
     async def _run_buffered(self, audio_stream: AsyncIterator[bytes]) -> AsyncIterator[TranscriptSegment]:
-        buffer = bytearray()
-
-        def buffer_ms() -> float:
-            # 2 bytes per sample for 16-bit PCM
-            return (len(buffer) / (self._sample_rate_hz * 2)) * 1000
+        # Preallocate one flush worth of audio and write into it by index so
+        # chunks are copied once instead of going through extend()'s regrowth.
+        buffer = bytearray(self._flush_bytes)
+        write_idx = 0
 
         async for chunk in audio_stream:
-            buffer.extend(chunk)
-            if buffer_ms() >= self._dev_buffer_ms or buffer_ms() >= self._max_buffer_ms:
-                segments = self._offline_recognize(bytes(buffer))
-                buffer.clear()
+            end = write_idx + len(chunk)
+            buffer[write_idx:end] = chunk
+            write_idx = end
+            if write_idx >= self._flush_bytes:
+                segments = self._offline_recognize(self._buffered_bytes(buffer, write_idx))
+                write_idx = 0
                 for segment in segments:
                     yield segment
 
-        if buffer:
-            segments = self._offline_recognize(bytes(buffer))
+        if write_idx:
+            segments = self._offline_recognize(self._buffered_bytes(buffer, write_idx))
             for segment in segments:
                 yield segment
 
+    @staticmethod
+    def _buffered_bytes(buffer: bytearray, length: int) -> bytes:
+        # Release the view straight away so the buffer can still grow.
+        with memoryview(buffer) as view:
+            return bytes(view[:length])
+
     async def stream_transcription(self, audio_stream: AsyncIterator[bytes]) -> AsyncIterator[TranscriptSegment]:
         """Yield transcript segments for a stream of audio chunks."""
 
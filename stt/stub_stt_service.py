@@ -13,7 +13,7 @@ from typing import AsyncIterator, Iterable, Optional, Sequence
 from pipecat.processors.frame_processor import FrameProcessor
 
 from stt.parakeet_adapter import ParakeetSTTAdapter
-from stt.parakeet_service import ParakeetService, TranscriptSegment
+from stt.parakeet_service import ParakeetService, TranscriptSegment, split_end_of_utterance
 
 
 class _MockParakeetService:
@@ -34,11 +34,7 @@ class _MockParakeetService:
             pass
 
         for text in self._transcripts:
-            cleaned = text
-            end_of_utterance = False
-            if self._end_of_utterance_token and self._end_of_utterance_token in text:
-                end_of_utterance = True
-                cleaned = text.replace(self._end_of_utterance_token, "").strip()
+            cleaned, end_of_utterance = split_end_of_utterance(text, self._end_of_utterance_token)
             yield TranscriptSegment(text=cleaned, is_final=True, end_of_utterance=end_of_utterance)
 
 
@@ -0,0 +1,42 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from core.configuration import load_app_config
+
+_CONFIG = """
+default_profile: dev
+profiles:
+  dev:
+    stt:
+      riva_uri: localhost:50051
+    tts:
+      flush_char_threshold: {threshold}
+"""
+
+
+def test_load_app_config_reuses_cached_result(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(_CONFIG.format(threshold=120))
+
+    first = load_app_config(path)
+    second = load_app_config(str(path))
+
+    assert first is second
+    assert first.profile(None).tts.flush_char_threshold == 120
+
+
+def test_load_app_config_reloads_when_file_changes(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(_CONFIG.format(threshold=120))
+    first = load_app_config(path)
+
+    path.write_text(_CONFIG.format(threshold=60))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = load_app_config(path)
+
+    assert second is not first
+    assert second.profile("dev").tts.flush_char_threshold == 60
@@ -0,0 +1,142 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import llm.model_router as model_router
+from llm.model_router import DEFAULT_GEMMA, DEFAULT_QWEN, GPUMemory, ModelRouter
+
+
+def _patch_vram(monkeypatch, total_gb, free_gb=None):
+    calls = []
+    memory = GPUMemory(total_gb=total_gb, free_gb=total_gb if free_gb is None else free_gb)
+
+    def fake_detect():
+        calls.append(memory)
+        return memory
+
+    monkeypatch.setattr(model_router, "_detect_gpu_memory", fake_detect)
+    return calls
+
+
+def test_select_model_reads_free_vram_each_time(monkeypatch):
+    calls = _patch_vram(monkeypatch, 16)
+    router = ModelRouter(min_vram_gb=12)
+
+    assert router.select_model("prod") == DEFAULT_QWEN
+    assert router.select_model("prod") == DEFAULT_QWEN
+    assert len(calls) == 2
+
+
+def test_gpu_probe_is_discovered_once(monkeypatch):
+    readings = []
+
+    def fake_nvml():
+        readings.append(1)
+        return GPUMemory(total_gb=12, free_gb=11)
+
+    monkeypatch.setattr(model_router, "_gpu_ruled_out", lambda: False)
+    monkeypatch.setattr(model_router.importlib.util, "find_spec", lambda name: name == "pynvml")
+    monkeypatch.setattr(model_router, "_nvml_memory", fake_nvml)
+    model_router._gpu_probe.cache_clear()
+    try:
+        assert model_router._detect_gpu_memory() == GPUMemory(total_gb=12, free_gb=11)
+        assert model_router._detect_gpu_memory() == GPUMemory(total_gb=12, free_gb=11)
+        # One reading to discover the probe, then one per call.
+        assert len(readings) == 3
+    finally:
+        model_router._gpu_probe.cache_clear()
+
+
+def test_select_model_falls_back_without_enough_vram(monkeypatch):
+    _patch_vram(monkeypatch, 4)
+    router = ModelRouter(min_vram_gb=12)
+
+    assert router.select_model("dev") == DEFAULT_GEMMA
+
+
+def test_idle_twelve_gib_card_selects_qwen(monkeypatch):
+    # The shipped defaults: the driver keeps a few hundred MiB of 12 GiB.
+    _patch_vram(monkeypatch, 12, free_gb=11.6)
+
+    assert ModelRouter().select_model("prod") == DEFAULT_QWEN
+
+
+def test_more_overhead_selects_smaller_model(monkeypatch):
+    _patch_vram(monkeypatch, 12, free_gb=11.6)
+
+    assert ModelRouter(min_vram_gb=10, os_vram_overhead_gb=1.5).select_model("prod") == DEFAULT_QWEN
+    assert ModelRouter(min_vram_gb=10, os_vram_overhead_gb=2).select_model("prod") == DEFAULT_GEMMA
+
+
+def test_desktop_crowded_card_falls_back_to_gemma(monkeypatch):
+    # 6 GiB free must not be enough however the overhead is configured.
+    _patch_vram(monkeypatch, 12, free_gb=6)
+
+    assert ModelRouter(min_vram_gb=10, os_vram_overhead_gb=0).select_model("dev") == DEFAULT_GEMMA
+    assert ModelRouter(min_vram_gb=10, os_vram_overhead_gb=2).select_model("dev") == DEFAULT_GEMMA
+
+
+def test_reclaimable_vram_counts_as_free(monkeypatch):
+    # Qwen kept resident by keep_alive leaves little free VRAM after a restart.
+    _patch_vram(monkeypatch, 12, free_gb=1.5)
+    router = ModelRouter()
+
+    assert router.select_model("prod") == DEFAULT_GEMMA
+    assert router.select_model("prod", reclaimable_gb=10) == DEFAULT_QWEN
+
+
+def test_override_model_skips_gpu_detection(monkeypatch):
+    calls = _patch_vram(monkeypatch, 16)
+    router = ModelRouter(override_model="custom:latest")
+
+    assert router.select_model("prod") == "custom:latest"
+    assert calls == []
+
+
+def test_force_model_env_var_skips_gpu_detection(monkeypatch):
+    calls = _patch_vram(monkeypatch, 16)
+    monkeypatch.setenv("LOCAL_CALL_FORCE_MODEL", "forced:latest")
+
+    assert ModelRouter().select_model("prod") == "forced:latest"
+    assert calls == []
+
+
+def test_hidden_cuda_devices_short_circuit_detection(monkeypatch):
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "")
+    model_router._gpu_probe.cache_clear()
+    try:
+        assert model_router._detect_gpu_memory() is None
+    finally:
+        model_router._gpu_probe.cache_clear()
+
+
+def test_persona_is_reread_only_after_it_changes(tmp_path):
+    path = tmp_path / "persona.md"
+    path.write_text("first persona\n")
+    router = ModelRouter(persona_path=path)
+    assert router.load_persona() == "first persona"
+
+    # Same mtime: the cached text is served even though the file changed.
+    stat = path.stat()
+    path.write_text("second persona\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert router.load_persona() == "first persona"
+
+    router.invalidate_persona()
+    assert router.load_persona() == "second persona"
+
+    path.write_text("third persona\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert router.load_persona() == "third persona"
+
+
+def test_wsl_gpu_device_is_not_ruled_out(monkeypatch):
+    monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+    monkeypatch.setattr(model_router.sys, "platform", "linux")
+    monkeypatch.setattr(model_router.os.path, "exists", lambda path: path == "/dev/dxg")
+    assert model_router._gpu_ruled_out() is False
+
+    monkeypatch.setattr(model_router.os.path, "exists", lambda path: False)
+    assert model_router._gpu_ruled_out() is True
@@ -0,0 +1,90 @@
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from pipecat.frames.frames import TextFrame
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from llm.model_router import ModelRouter
+from llm.ollama_client import OllamaClient
+from tools.registry import ToolRegistry
+
+
+class _FakeChatClient:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def chat(self, **_kwargs):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _client_with_chunks(chunks):
+    client = OllamaClient(ModelRouter(), ToolRegistry(), system_prompt="system")
+    client._client = _FakeChatClient(chunks)  # type: ignore[assignment]
+    pushed = []
+
+    async def _push(frame, direction):
+        pushed.append(frame)
+
+    client.push_frame = _push  # type: ignore[assignment]
+    return client, pushed
+
+
+def test_stream_completion_coalesces_deltas_into_phrases():
+    deltas = ["Hel", "lo", ",", " how", " are", " you", "?", " Fine", " thanks"]
+    client, pushed = _client_with_chunks([{"message": {"content": delta}} for delta in deltas])
+
+    tool_calls, content = asyncio.run(client._stream_completion("model", None))
+
+    assert tool_calls == []
+    assert content == "Hello, how are you? Fine thanks"
+    assert [frame.text for frame in pushed if isinstance(frame, TextFrame)] == [
+        "Hello,",
+        " how are you?",
+        " Fine thanks",
+    ]
+
+
+class _RecordingRouter(ModelRouter):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def select_model(self, profile, *, reclaimable_gb=0.0):
+        self.calls.append((threading.get_ident(), reclaimable_gb))
+        return "chosen:latest"
+
+
+class _FakeOllama:
+    def __init__(self):
+        self.generated = []
+
+    async def ps(self):
+        return SimpleNamespace(models=[SimpleNamespace(size_vram=9 * 1024**3)])
+
+    async def generate(self, **kwargs):
+        self.generated.append(kwargs["model"])
+
+
+def test_model_is_selected_once_off_the_event_loop():
+    router = _RecordingRouter()
+    client = OllamaClient(router, ToolRegistry(), system_prompt="system")
+    fake = _FakeOllama()
+    client._client = fake  # type: ignore[assignment]
+
+    async def _run():
+        await client._warm_up()
+        return await client._session_model(), threading.get_ident()
+
+    model, loop_thread = asyncio.run(_run())
+
+    assert model == "chosen:latest"
+    assert fake.generated == ["chosen:latest"]
+    assert len(router.calls) == 1
+    probe_thread, reclaimable_gb = router.calls[0]
+    assert probe_thread != loop_thread
+    assert reclaimable_gb == 9
@@ -0,0 +1,88 @@
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+from pipecat.frames.frames import EndFrame, InputAudioRawFrame, TranscriptionFrame
+from pipecat.processors.frame_processor import FrameDirection
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from stt.parakeet_adapter import ParakeetSTTAdapter
+from stt.parakeet_service import ParakeetService, TranscriptSegment
+
+# 20 ms of 16 kHz, 16-bit mono PCM.
+_CHUNK_BYTES = 640
+
+
+def _stalled_riva(service: ParakeetService, release: threading.Event, received: List[bytes]):
+    """Stand in for Riva: stall until released, then consume all queued audio."""
+
+    def _stream_with_riva(audio_generator):
+        release.wait(timeout=5)
+        received.extend(audio_generator)
+        yield TranscriptSegment(text=f"{len(received)} chunks", is_final=True)
+
+    service._stream_with_riva = _stream_with_riva  # type: ignore[assignment]
+
+
+async def _run_adapter_burst():
+    service = ParakeetService(dev_mode=False)
+    release = threading.Event()
+    received: List[bytes] = []
+    _stalled_riva(service, release, received)
+
+    adapter = ParakeetSTTAdapter(service)
+    transcripts: List[TranscriptionFrame] = []
+
+    async def _push(frame, direction):
+        if isinstance(frame, TranscriptionFrame):
+            transcripts.append(frame)
+
+    adapter.push_frame = _push  # type: ignore[assignment]
+
+    # Pipecat hands audio over back-to-back without yielding to the loop.
+    chunks = [bytes([index]) * _CHUNK_BYTES for index in range(50)]
+    for chunk in chunks:
+        await adapter.process_frame(
+            InputAudioRawFrame(audio=chunk, sample_rate=16000, num_channels=1),
+            FrameDirection.DOWNSTREAM,
+        )
+    await asyncio.sleep(0.05)
+    release.set()
+    await adapter.process_frame(EndFrame(), FrameDirection.DOWNSTREAM)
+    return service, chunks, received, transcripts
+
+
+async def _run_overflow():
+    service = ParakeetService(dev_mode=False, max_queued_audio_ms=100)
+    release = threading.Event()
+    received: List[bytes] = []
+    _stalled_riva(service, release, received)
+    chunks = [bytes([index]) * _CHUNK_BYTES for index in range(50)]
+
+    async def _audio():
+        for chunk in chunks:
+            yield chunk
+        release.set()
+
+    segments = [segment async for segment in service.stream_transcription(_audio())]
+    return service, chunks, received, segments
+
+
+def test_burst_within_limit_loses_no_audio():
+    service, chunks, received, transcripts = asyncio.run(_run_adapter_burst())
+
+    assert received == chunks
+    assert service.dropped_audio_bytes == 0
+    assert [frame.text for frame in transcripts] == ["50 chunks"]
+
+
+def test_stalled_recogniser_keeps_newest_audio():
+    service, chunks, received, segments = asyncio.run(_run_overflow())
+
+    # 100 ms holds five 20 ms chunks; everything older is dropped.
+    assert received == chunks[-5:]
+    assert service.dropped_audio_bytes == 45 * _CHUNK_BYTES
+    assert [segment.text for segment in segments] == ["5 chunks"]
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from tools.registry import Tool, ToolRegistry, create_default_registry
+
+
+async def _noop() -> str:
+    return "ok"
+
+
+def test_tool_schemas_are_cached_until_register():
+    registry = create_default_registry()
+
+    schemas = registry.tool_schemas()
+    assert registry.tool_schemas() is schemas
+
+    registry.register(Tool(name="noop", description="", parameters={"type": "object"}, function=_noop))
+    refreshed = registry.tool_schemas()
+
+    assert refreshed is not schemas
+    assert refreshed[-1]["function"]["name"] == "noop"
+    assert refreshed[0] is schemas[0]
+
+
+def test_tool_schemas_serialise_as_json():
+    payload = json.loads(json.dumps(create_default_registry().tool_schemas()))
+
+    assert payload[0]["type"] == "function"
+    assert payload[0]["function"]["name"] == "web_search"
+
+
+def test_http_session_is_shared_and_closed():
+    async def _run():
+        registry = ToolRegistry()
+        session = await registry.http_session()
+        assert await registry.http_session() is session
+        await registry.aclose()
+        assert session.closed
+
+    asyncio.run(_run())
+
+
+def test_memory_view_is_read_only_and_live():
+    async def _run():
+        registry = create_default_registry()
+        view = registry.memory_view()
+        await registry.invoke("remember", {"key": "name", "value": "Ada"})
+        return view
+
+    view = asyncio.run(_run())
+    assert view == {"name": "Ada"}
+    with pytest.raises(TypeError):
+        view["name"] = "Grace"  # type: ignore[index]
+
+
+def test_memory_snapshot_does_not_see_later_writes():
+    async def _run():
+        registry = create_default_registry()
+        await registry.invoke("remember", {"key": "name", "value": "Ada"})
+        snapshot = registry.memory_snapshot()
+        await registry.invoke("remember", {"key": "name", "value": "Grace"})
+        return snapshot
+
+    assert asyncio.run(_run()) == {"name": "Ada"}
+
+
+def test_invoke_limits_concurrent_tool_calls():
+    async def _run():
+        registry = ToolRegistry(max_concurrent_tools=2)
+        running = 0
+        peak = 0
+
+        async def slow() -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "done"
+
+        registry.register(Tool(name="slow", description="", parameters={"type": "object"}, function=slow))
+        results = await asyncio.gather(*(registry.invoke("slow", {}) for _ in range(5)))
+        return results, peak
+
+    results, peak = asyncio.run(_run())
+    assert results == ["done"] * 5
+    assert peak == 2
@@ -0,0 +1,49 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from core.session import Session
+
+
+class _Runner:
+    def __init__(self, cancel):
+        self._cancel = cancel
+
+    async def cancel(self):
+        await self._cancel()
+
+
+def _session_with(cancel) -> Session:
+    session = Session(transport=None, profile=None)
+    session.runner = _Runner(cancel)  # type: ignore[assignment]
+    return session
+
+
+def test_stop_tolerates_cancellation_raised_by_the_runner():
+    async def cancel():
+        raise asyncio.CancelledError
+
+    async def _run():
+        session = _session_with(cancel)
+        await session.stop()
+        return session.runner
+
+    assert asyncio.run(_run()) is None
+
+
+def test_stop_propagates_external_cancellation():
+    async def cancel():
+        await asyncio.sleep(1)
+
+    async def _run():
+        task = asyncio.create_task(_session_with(cancel).stop())
+        await asyncio.sleep(0)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(_run())
@@ -176,3 +176,142 @@ async def _run_interruption_test():
 
     assert service._generation_task is None
     assert len(captured) < len("streaming tokens")
+
+
+def test_tool_calls_run_concurrently_and_keep_order():
+    asyncio.run(_run_concurrent_tools_test())
+
+
+async def _run_concurrent_tools_test():
+    router = ModelRouter()
+    registry = ToolRegistry()
+    second_started = asyncio.Event()
+
+    async def first():
+        # Only completes if "second" is allowed to start while this one waits.
+        await asyncio.wait_for(second_started.wait(), timeout=0.5)
+        return "first done"
+
+    async def second():
+        second_started.set()
+        return "second done"
+
+    for name, function in (("first", first), ("second", second)):
+        registry.register(
+            Tool(
+                name=name,
+                description=name,
+                parameters={"type": "object", "properties": {}},
+                function=function,
+            )
+        )
+
+    responses = [
+        StubResponse(
+            tool_calls=[
+                {"id": "call_1", "function": {"name": "first", "arguments": "{}"}},
+                {"id": "call_2", "function": {"name": "second", "arguments": "{}"}},
+            ]
+        ),
+        StubResponse(tokens=["All done."]),
+    ]
+    service = StubLLMService(router, registry, responses=responses)
+    await _capture_frames(service)
+
+    await service.process_frame(TextFrame("hi"), FrameDirection.DOWNSTREAM)
+    await service.process_frame(EndOfUtteranceFrame(), FrameDirection.DOWNSTREAM)
+    await _await_generation(service)
+
+    tool_messages = [message for message in service._messages if message["role"] == "tool"]
+    assert [message["content"] for message in tool_messages] == ["first done", "second done"]
+
+
+def test_history_is_trimmed_to_token_budget():
+    asyncio.run(_run_history_trim_test())
+
+
+async def _run_history_trim_test():
+    router = ModelRouter()
+    registry = ToolRegistry()
+    # Each turn is ~40 characters (~10 tokens) of user text plus its reply.
+    responses = [StubResponse(tokens=[f"reply number {turn:02d} " * 2]) for turn in range(6)]
+    service = StubLLMService(
+        router,
+        registry,
+        responses=responses,
+        system_prompt="system",
+        max_context_tokens=30,
+    )
+    await _capture_frames(service)
+
+    for turn in range(6):
+        await service.process_frame(TextFrame(f"user message number {turn:02d} " * 2), FrameDirection.DOWNSTREAM)
+        await service.process_frame(EndOfUtteranceFrame(), FrameDirection.DOWNSTREAM)
+        await _await_generation(service)
+
+    messages = list(service._messages)
+    assert messages[0] == {"role": "system", "content": "system"}
+    assert messages[1]["role"] == "user"
+    assert "05" in messages[-1]["content"]
+    assert len(messages) < 1 + 2 * 6
+
+
+def test_tools_registered_after_construction_are_sent():
+    requested = asyncio.run(_run_late_tool_test())
+
+    assert requested[0] is None
+    assert [schema["function"]["name"] for schema in requested[1]] == ["late"]
+
+
+async def _run_late_tool_test():
+    registry = ToolRegistry()
+    service = StubLLMService(ModelRouter(), registry, responses=[], system_prompt="system")
+    await _capture_frames(service)
+    requested = []
+
+    async def _record(model, tools):
+        requested.append(tools)
+        return [], ""
+
+    service._stream_completion = _record  # type: ignore[assignment]
+    await service._run_chat_with_tools(depth=0)
+    registry.register(
+        Tool(
+            name="late",
+            description="Registered after the client was built",
+            parameters={"type": "object", "properties": {}},
+            function=lambda: asyncio.sleep(0, result="ok"),
+        )
+    )
+    await service._run_chat_with_tools(depth=0)
+    return requested
+
+
+def test_filler_is_spoken_while_tools_run():
+    asyncio.run(_run_filler_test())
+
+
+async def _run_filler_test():
+    registry = ToolRegistry()
+
+    async def ping():
+        return "pong"
+
+    registry.register(
+        Tool(name="ping", description="ping", parameters={"type": "object", "properties": {}}, function=ping)
+    )
+    responses = [
+        StubResponse(tool_calls=[{"id": "call_1", "function": {"name": "ping", "arguments": "{}"}}]),
+        StubResponse(tokens=["Pong."]),
+    ]
+    service = StubLLMService(ModelRouter(), registry, responses=responses, system_prompt="system")
+    captured = await _capture_frames(service)
+
+    await service.process_frame(TextFrame("hi"), FrameDirection.DOWNSTREAM)
+    await service.process_frame(EndOfUtteranceFrame(), FrameDirection.DOWNSTREAM)
+    await _await_generation(service)
+
+    texts = [frame.text for frame, _ in captured if isinstance(frame, TextFrame)]
+    assert texts[0] == "One moment."
+    assert texts[-1] == "Pong."
+    assert all(message.get("content") != "One moment." for message in service._messages)
@@ -9,11 +9,23 @@ from pipecat.processors.frame_processor import FrameDirection
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from stt.parakeet_adapter import EndOfUtteranceFrame
+from stt.parakeet_service import TranscriptSegment, split_end_of_utterance
 from stt.stub_stt_service import StubSTTService
 
 
-async def _run_stub(transcripts) -> List[Tuple[object, FrameDirection]]:
-    service = StubSTTService(transcripts=transcripts)
+class _InterimService:
+    """Emit a burst of interim segments followed by a final one."""
+
+    async def stream_transcription(self, audio_stream):
+        async for _ in audio_stream:
+            pass
+        yield TranscriptSegment(text="hello", is_final=False)
+        yield TranscriptSegment(text="there", is_final=False)
+        yield TranscriptSegment(text="friend", is_final=True, end_of_utterance=True)
+
+
+async def _run_stub(transcripts, service=None) -> List[Tuple[object, FrameDirection]]:
+    service = StubSTTService(transcripts=transcripts, service=service)
     captured: List[Tuple[object, FrameDirection]] = []
 
     async def _push(frame, direction):
@@ -42,3 +54,16 @@ def test_stub_stt_emits_end_of_utterance_frame():
     end_of_utterance, eou_direction = frames[1]
     assert isinstance(end_of_utterance, EndOfUtteranceFrame)
     assert eou_direction == FrameDirection.DOWNSTREAM
+
+
+def test_interim_segments_are_coalesced_into_one_frame():
+    frames = asyncio.run(_run_stub(None, service=_InterimService()))
+
+    assert [type(frame) for frame, _ in frames] == [TranscriptionFrame, EndOfUtteranceFrame]
+    assert frames[0][0].text == "hello there friend"
+
+
+def test_split_end_of_utterance():
+    assert split_end_of_utterance("all done <EOU>", "<EOU>") == ("all done", True)
+    assert split_end_of_utterance(" still talking ", "<EOU>") == (" still talking ", False)
+    assert split_end_of_utterance("text <EOU>", "") == ("text <EOU>", False)
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+import websockets
+from websockets.exceptions import ConnectionClosedError
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from tts.vibevoice_service import VibeVoiceService
+
+
+class _RecordingWebSocket:
+    def __init__(self):
+        self.sent: List[dict] = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+async def _texts(*chunks: str):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _with_server(handler, client):
+    async with websockets.serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        return await client(VibeVoiceService(f"ws://127.0.0.1:{port}"))
+
+
+async def _run_send_texts(fragments: List[str]) -> List[dict]:
+    websocket = _RecordingWebSocket()
+    await VibeVoiceService()._send_texts(websocket, _texts(*fragments))
+    return websocket.sent
+
+
+def test_send_texts_keeps_words_split_across_fragments():
+    fragments = ["That was extra", "ordinary", " under", "standing, thanks."]
+
+    sent = asyncio.run(_run_send_texts(fragments))
+
+    assert sent[-1] == {"type": "eos"}
+    texts = [message["text"] for message in sent[:-1]]
+    assert "".join(texts) == "That was extraordinary understanding, thanks."
+
+
+def test_stream_synthesis_yields_audio_until_done():
+    received: List[dict] = []
+
+    async def handler(websocket):
+        async for message in websocket:
+            payload = json.loads(message)
+            received.append(payload)
+            if payload["type"] == "text":
+                await websocket.send(b"\x01\x02")
+            elif payload["type"] == "eos":
+                await websocket.send(json.dumps({"type": "done"}))
+
+    async def client(service):
+        return [audio async for audio in service.stream_synthesis(_texts("Hello."))]
+
+    audio = asyncio.run(_with_server(handler, client))
+
+    assert audio == [b"\x01\x02"]
+    assert [payload["type"] for payload in received] == ["config", "text", "eos"]
+
+
+def test_slow_consumer_receives_every_frame_in_order():
+    frames = [index.to_bytes(2, "big") for index in range(200)]
+
+    async def handler(websocket):
+        async for message in websocket:
+            if json.loads(message)["type"] == "eos":
+                for frame in frames:
+                    await websocket.send(frame)
+                await websocket.send(json.dumps({"type": "done"}))
+
+    async def client(service):
+        audio = []
+        async for frame in service.stream_synthesis(_texts("Hello.")):
+            audio.append(frame)
+            await asyncio.sleep(0)
+        return audio
+
+    assert asyncio.run(_with_server(handler, client)) == frames
+
+
+def test_consumer_stopping_early_closes_the_connection():
+    closed = asyncio.Event()
+
+    async def handler(websocket):
+        try:
+            async for _ in websocket:
+                await websocket.send(b"\x01\x02")
+        finally:
+            closed.set()
+
+    async def client(service):
+        stream = service.stream_synthesis(_texts("Hello."))
+        first = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.wait_for(closed.wait(), timeout=1)
+        return first
+
+    assert asyncio.run(_with_server(handler, client)) == b"\x01\x02"
+
+
+def test_server_error_close_is_raised_after_queued_audio():
+    audio: List[bytes] = []
+
+    async def handler(websocket):
+        async for message in websocket:
+            if json.loads(message)["type"] == "eos":
+                for _ in range(100):
+                    await websocket.send(b"\x01\x02")
+                await websocket.close(code=1011, reason="synthesis failed")
+
+    async def client(service):
+        async for frame in service.stream_synthesis(_texts("Hello.")):
+            audio.append(frame)
+
+    with pytest.raises(ConnectionClosedError) as excinfo:
+        asyncio.run(_with_server(handler, client))
+
+    assert excinfo.value.rcvd.code == 1011
+    assert audio
@@ -1,24 +1,28 @@
 """Tool registry and default tool implementations."""
 from __future__ import annotations
 
+import asyncio
 import importlib.util
-from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, List
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Sequence, Tuple
 
 import aiohttp
 
 ToolFunc = Callable[..., Awaitable[str]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Tool:
     name: str
     description: str
     parameters: Dict[str, Any]
     function: ToolFunc
+    _schema: Dict[str, Any] = field(init=False, repr=False, compare=False)
 
-    def to_openai_schema(self) -> Dict[str, Any]:
-        return {
+    def __post_init__(self):
+        # Built once and shared; kept a plain dict so it serialises as JSON.
+        schema = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -26,34 +30,72 @@ class Tool:
                 "parameters": self.parameters,
             },
         }
+        object.__setattr__(self, "_schema", schema)
+
+    def to_openai_schema(self) -> Dict[str, Any]:
+        return self._schema
 
 
 class ToolRegistry:
     """Register and invoke JSON-schema tools."""
 
-    def __init__(self):
+    def __init__(self, *, max_concurrent_tools: int = 8):
         self._tools: Dict[str, Tool] = {}
         self._memory: Dict[str, str] = {}
+        self._memory_view: Mapping[str, str] = MappingProxyType(self._memory)
         self._mode: str = "dev"
+        self._schema_cache: Optional[Tuple[Dict[str, Any], ...]] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        # Bounds how many tool calls from one response run at the same time.
+        self._tool_semaphore = asyncio.Semaphore(max_concurrent_tools)
 
     def register(self, tool: Tool):
         self._tools[tool.name] = tool
+        self._schema_cache = None
 
-    def tool_schemas(self) -> List[Dict[str, Any]]:
-        return [tool.to_openai_schema() for tool in self._tools.values()]
+    def tool_schemas(self) -> Sequence[Dict[str, Any]]:
+        if self._schema_cache is None:
+            self._schema_cache = tuple(tool.to_openai_schema() for tool in self._tools.values())
+        return self._schema_cache
 
     async def invoke(self, name: str, arguments: Dict[str, Any]) -> str:
         tool = self._tools.get(name)
         if not tool:
             return f"Unknown tool: {name}"
         try:
-            return await tool.function(**arguments)
+            async with self._tool_semaphore:
+                return await tool.function(**arguments)
         except TypeError as exc:
             return f"Invalid arguments for {name}: {exc}"
         except Exception as exc:  # pragma: no cover - runtime guard
             return f"Tool {name} failed: {exc}"
 
+    async def http_session(self) -> aiohttp.ClientSession:
+        """Return a shared HTTP session so tool calls reuse pooled connections."""
+
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                        timeout=aiohttp.ClientTimeout(total=10),
+                    )
+        return self._session
+
+    async def aclose(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def memory_view(self) -> Mapping[str, str]:
+        """Return a read-only live view of memory, reflecting later writes."""
+
+        return self._memory_view
+
     def memory_snapshot(self) -> Dict[str, str]:
+        """Return a copy of memory as it is now."""
+
         return dict(self._memory)
 
     def mode(self) -> str:
@@ -68,7 +110,8 @@ async def _web_search(query: str, recency_days: int = 30, max_results: int = 5)
 
     client = TavilyClient()
     try:
-        results = client.search(query=query, max_results=max_results, days=recency_days)
+        # The Tavily client is synchronous; keep it off the event loop.
+        results = await asyncio.to_thread(client.search, query=query, max_results=max_results, days=recency_days)
     except Exception as exc:  # pragma: no cover - external dependency
         return f"Search failed: {exc}"
 
@@ -84,17 +127,29 @@ async def _web_search(query: str, recency_days: int = 30, max_results: int = 5)
     return "\n\n".join(lines)
 
 
-async def _fetch_url(url: str) -> str:
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url, timeout=10) as resp:
-                resp.raise_for_status()
-                text = await resp.text()
-        except Exception as exc:  # pragma: no cover - network path
-            return f"Failed to fetch {url}: {exc}"
+_FETCH_MAX_CHARS = 2000
+# Enough bytes for the character cap even if every character is 4-byte UTF-8.
+_FETCH_MAX_BYTES = _FETCH_MAX_CHARS * 4
+
+
+async def _fetch_url(registry: ToolRegistry, url: str) -> str:
+    session = await registry.http_session()
+    body = bytearray()
+    try:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            # Stop reading once the cap is reached instead of decoding the whole page.
+            async for chunk in resp.content.iter_chunked(4096):
+                body += chunk
+                if len(body) >= _FETCH_MAX_BYTES:
+                    break
+            truncated = not resp.content.at_eof()
+            text = body.decode(resp.charset or "utf-8", errors="replace")
+    except Exception as exc:  # pragma: no cover - network path
+        return f"Failed to fetch {url}: {exc}"
     snippet = text.strip()
-    if len(snippet) > 2000:
-        snippet = snippet[:2000] + "..."
+    if truncated or len(snippet) > _FETCH_MAX_CHARS:
+        snippet = snippet[:_FETCH_MAX_CHARS] + "..."
     return snippet
 
 
@@ -154,7 +209,7 @@ def create_default_registry() -> ToolRegistry:
                 },
                 "required": ["url"],
             },
-            function=_fetch_url,
+            function=lambda url, registry=registry: _fetch_url(registry, url),
         )
     )
 
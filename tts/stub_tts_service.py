@@ -2,6 +2,8 @@
 """
 This module defines a stub implementation of a Text-to-Speech service.
 """
+import sys
+
 from pipecat.processors.frame_processor import FrameProcessor
 from pipecat.frames.frames import TextFrame, Frame, AudioFrame
 from pipecat.processors.frame_processor import FrameDirection
@@ -18,7 +20,9 @@ class StubTTSService(FrameProcessor):
         Processes a text frame and prints it to the console.
         """
         if isinstance(frame, TextFrame):
-            print(f"TTS: {frame.text}")
+            # Looked up per call so stdout redirection is honoured; a plain
+            # buffered write skips print()'s separator and end handling.
+            sys.stdout.write(f"TTS: {frame.text}\n")
             await self.push_frame(AudioFrame(b""), direction)
         else:
             await self.push_frame(frame, direction)
@@ -3,12 +3,15 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-from typing import AsyncIterator, List, Optional
+import io
+import re
+from typing import AsyncIterator, Optional
 
 from pipecat.frames.frames import (
     BotInterruptionFrame,
     BotStartedSpeakingFrame,
     BotStoppedSpeakingFrame,
+    EndFrame,
     Frame,
     InterruptionFrame,
     OutputAudioRawFrame,
@@ -19,6 +22,9 @@ from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
 from tts.vibevoice_service import VibeVoiceService
 
+_INTERRUPTION_FRAMES = (InterruptionFrame, BotInterruptionFrame)
+_SENTENCE_END_RE = re.compile(r"[.!?]")
+
 
 class VibeVoiceAdapter(FrameProcessor):
     """Convert streamed :class:`TextFrame` tokens into VibeVoice audio."""
@@ -38,7 +44,9 @@ class VibeVoiceAdapter(FrameProcessor):
         self._flush_on_punctuation = flush_on_punctuation
         self._flush_char_threshold = flush_char_threshold
         self._sample_rate_hz = sample_rate_hz
-        self._buffer: List[str] = []
+        self._pending = io.StringIO()
+        # Characters buffered; StringIO.tell() is an opaque cookie, not a count.
+        self._pending_len = 0
         self._text_queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
         self._stream_task: Optional[asyncio.Task[None]] = None
         self._burst_task: Optional[asyncio.Task[None]] = None
@@ -46,7 +54,8 @@ class VibeVoiceAdapter(FrameProcessor):
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         if isinstance(frame, TextFrame):
-            self._buffer.append(frame.text)
+            self._pending.write(frame.text)
+            self._pending_len += len(frame.text)
             await self.push_frame(
                 TTSTextFrame(frame.text, includes_inter_frame_spaces=True),
                 FrameDirection.DOWNSTREAM,
@@ -58,12 +67,12 @@ class VibeVoiceAdapter(FrameProcessor):
                 await self._flush_buffer(streaming=False)
             return
 
-        if isinstance(frame, (InterruptionFrame, BotInterruptionFrame)):
+        if isinstance(frame, _INTERRUPTION_FRAMES):
             await self._cancel_playback()
             return
 
-        if frame.__class__.__name__ == "EndFrame":
-            await self._flush_buffer(streaming=self._streaming_mode, force=True)
+        if isinstance(frame, EndFrame):
+            await self._flush_buffer(streaming=self._streaming_mode)
             if self._streaming_mode:
                 await self._stop_streaming()
             else:
@@ -113,35 +122,38 @@ class VibeVoiceAdapter(FrameProcessor):
                 self._burst_task = None
             await self._maybe_emit_stopped()
 
-    async def _flush_buffer(self, *, streaming: bool, force: bool = False):
-        if not self._buffer:
-            return
-
-        text = "".join(self._buffer).strip()
-        if not text:
-            self._buffer.clear()
+    async def _flush_buffer(self, *, streaming: bool):
+        if not self._pending_len:
             return
 
-        if not force and not streaming and not self._should_flush(text):
+        # Burst callers only get here once _should_flush() has said yes.
+        text = self._pending.getvalue()
+        self._clear_buffer()
+        if not text.strip():
             return
 
-        self._buffer.clear()
         if streaming:
+            # Flushes can land mid-word, so the server gets the raw text and
+            # rejoins it without adding separators.
             await self._text_queue.put(text)
         else:
+            text = text.strip()
             await self._drain_burst_task()
             self._burst_task = asyncio.create_task(self._play_burst(text))
 
     def _should_flush(self, latest_text: str) -> bool:
-        if not self._buffer and not latest_text:
-            return False
-        combined = "".join(self._buffer) or latest_text
-        if self._flush_on_punctuation and any(p in combined for p in {".", "!", "?"}):
+        # The buffer is emptied on every flush, so earlier tokens never held
+        # a sentence end and only the newest text needs scanning.
+        if self._flush_on_punctuation and _SENTENCE_END_RE.search(latest_text):
             return True
-        if self._flush_char_threshold and len(combined) >= self._flush_char_threshold:
+        if self._flush_char_threshold and self._pending_len >= self._flush_char_threshold:
             return True
         return False
 
+    def _clear_buffer(self):
+        self._pending = io.StringIO()
+        self._pending_len = 0
+
     async def _play_burst(self, text: str):
         if not self._speaking:
             self._speaking = True
@@ -154,7 +166,7 @@ class VibeVoiceAdapter(FrameProcessor):
         await self._maybe_emit_stopped()
 
     async def _cancel_playback(self):
-        self._buffer.clear()
+        self._clear_buffer()
         if self._streaming_mode:
             await self._service.cancel()
             if self._stream_task:
@@ -163,11 +175,10 @@ class VibeVoiceAdapter(FrameProcessor):
                     await self._stream_task
                 self._stream_task = None
             await self._maybe_emit_interrupted()
-            while not self._text_queue.empty():
-                try:
-                    self._text_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+            if not self._text_queue.empty():
+                # The consumer was cancelled above, so nothing is waiting on
+                # the old queue and it can simply be dropped.
+                self._text_queue = asyncio.Queue()
         else:
             if self._burst_task:
                 self._burst_task.cancel()
@@ -2,13 +2,42 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import binascii
+import contextlib
 import json
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, List, Optional
 
 import websockets
 from websockets import WebSocketClientProtocol
+from websockets.exceptions import ConnectionClosedOK
+
+try:  # SIMD-accelerated drop-in for the stdlib decoder, when installed
+    import pybase64 as base64
+except ImportError:  # pragma: no cover - optional dependency
+    import base64
+
+try:
+    import orjson
+
+    def _dumps(payload: dict) -> str:
+        # orjson emits UTF-8 bytes; decode so messages still go out as text frames.
+        return orjson.dumps(payload).decode()
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Text chunks arriving this close together are sent as one message.
+_BATCH_WINDOW_S = 0.005
+_BATCH_MAX_CHARS = 256
+
+# Audio frames held for a slow consumer before the receiver stops reading and
+# lets websocket flow control push back on the server.
+_AUDIO_QUEUE_MAX_FRAMES = 64
+
+# Kept as text: the server reads control messages from text frames only.
+_EOS_MESSAGE = _dumps({"type": "eos"})
 
 
 class VibeVoiceService:
@@ -28,32 +57,47 @@ class VibeVoiceService:
         voice: Optional[str] = None,
         dev_mode: bool = False,
         connect_timeout: float = 5.0,
+        binary_audio: bool = True,
+        recv_timeout: Optional[float] = None,
     ) -> None:
         self._server_uri = server_uri
         self._voice = voice
         self._dev_mode = dev_mode
         self._connect_timeout = connect_timeout
+        self._binary_audio = binary_audio
+        self._recv_timeout = recv_timeout
+        self._config_message = self._build_config_message()
         self._current_websocket: Optional[WebSocketClientProtocol] = None
         self._lock = asyncio.Lock()
 
-    async def _connect(self) -> WebSocketClientProtocol:
-        websocket = await websockets.connect(self._server_uri, open_timeout=self._connect_timeout, max_size=None)
-        config: dict[str, str] = {}
+    def _build_config_message(self) -> Optional[str]:
+        config: dict[str, str | bool] = {}
+        if self._binary_audio:
+            # Raw PCM frames skip the base64 round trip and its ~33% size overhead.
+            config["binary"] = True
         if self._voice:
             config["voice"] = self._voice
         if self._dev_mode:
             config["mode"] = "burst"
-        if config:
-            await websocket.send(json.dumps({"type": "config", **config}))
+        if not config:
+            return None
+        return _dumps({"type": "config", **config})
+
+    async def _connect(self) -> WebSocketClientProtocol:
+        websocket = await websockets.connect(self._server_uri, open_timeout=self._connect_timeout, max_size=None)
+        if self._config_message:
+            await websocket.send(self._config_message)
         self._current_websocket = websocket
         return websocket
 
     @staticmethod
-    def _decode_audio(message: str | bytes) -> Optional[bytes]:
+    def _decode_audio(message: str | bytes | bytearray | memoryview) -> Optional[bytes]:
         if isinstance(message, bytes):
             return message
+        if isinstance(message, (bytearray, memoryview)):
+            return bytes(message)
         try:
-            payload = json.loads(message)
+            payload = _loads(message)
         except json.JSONDecodeError:
             return None
         audio_base64 = payload.get("audio")
@@ -70,42 +114,116 @@ class VibeVoiceService:
         async with self._lock:
             websocket = await self._connect()
 
-        async def sender():
+        # Sending and receiving run as a task group in their own task, so the
+        # group's cancel scope never spans a yield back to the caller.
+        audio_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=_AUDIO_QUEUE_MAX_FRAMES)
+        session = asyncio.create_task(self._run_session(websocket, text_stream, audio_queue))
+        try:
+            while (audio := await audio_queue.get()) is not None:
+                yield audio
             try:
-                async for text in text_stream:
-                    if not text:
-                        continue
-                    await websocket.send(json.dumps({"type": "text", "text": text}))
-                await websocket.send(json.dumps({"type": "eos"}))
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                await websocket.close()
+                await session
+            except BaseExceptionGroup as group:
+                if len(group.exceptions) == 1:
+                    raise group.exceptions[0] from None
                 raise
+        finally:
+            if not session.done():
+                session.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await session
+            await websocket.close()
+            if self._current_websocket is websocket:
+                self._current_websocket = None
 
-        send_task = asyncio.create_task(sender())
+    async def _run_session(
+        self,
+        websocket: WebSocketClientProtocol,
+        text_stream: AsyncIterator[str],
+        audio_queue: asyncio.Queue[Optional[bytes]],
+    ):
         try:
-            async for message in websocket:
-                audio = self._decode_audio(message)
-                if audio:
-                    yield audio
-                else:
+            async with asyncio.TaskGroup() as group:
+                send_task = group.create_task(self._send_texts(websocket, text_stream))
+                group.create_task(self._receive_audio(websocket, audio_queue, send_task))
+        except BaseException:
+            # Failed or cancelled: the caller is about to raise or has stopped
+            # reading, so make room for the sentinel rather than wait for it.
+            if audio_queue.full():
+                audio_queue.get_nowait()
+            audio_queue.put_nowait(None)
+            raise
+        await audio_queue.put(None)
+
+    async def _send_texts(self, websocket: WebSocketClientProtocol, text_stream: AsyncIterator[str]):
+        loop = asyncio.get_running_loop()
+        texts = text_stream.__aiter__()
+        batch: List[str] = []
+        batch_len = 0
+        send_at = 0.0
+        # The in-flight read is kept across timeouts; cancelling it would close the stream.
+        next_text: Optional[asyncio.Future[str]] = None
+        try:
+            while True:
+                if next_text is None:
+                    next_text = asyncio.ensure_future(texts.__anext__())
+                timeout = max(0.0, send_at - loop.time()) if batch else None
+                done, _ = await asyncio.wait({next_text}, timeout=timeout)
+                if done:
+                    finished, next_text = next_text, None
                     try:
-                        payload = json.loads(message)
-                        if payload.get("type") == "done":
-                            break
-                    except (TypeError, json.JSONDecodeError):
+                        text = finished.result()
+                    except StopAsyncIteration:
+                        break
+                    if not text:
+                        continue
+                    if not batch:
+                        send_at = loop.time() + _BATCH_WINDOW_S
+                    batch.append(text)
+                    batch_len += len(text)
+                    if batch_len < _BATCH_MAX_CHARS:
                         continue
+                await self._send_text(websocket, batch)
+                batch = []
+                batch_len = 0
+            if batch:
+                await self._send_text(websocket, batch)
+            await websocket.send(_EOS_MESSAGE)
         finally:
-            if not send_task.done():
-                send_task.cancel()
+            if next_text is not None:
+                next_text.cancel()
+
+    async def _receive_audio(
+        self,
+        websocket: WebSocketClientProtocol,
+        audio_queue: asyncio.Queue[Optional[bytes]],
+        send_task: asyncio.Task[None],
+    ):
+        try:
+            while True:
+                async with asyncio.timeout(self._recv_timeout):
+                    message = await websocket.recv()
+                audio = self._decode_audio(message)
+                if audio:
+                    await audio_queue.put(audio)
+                    continue
                 try:
-                    await send_task
-                except asyncio.CancelledError:
-                    pass
-            await websocket.close()
-            if self._current_websocket is websocket:
-                self._current_websocket = None
+                    payload = _loads(message)
+                except (TypeError, json.JSONDecodeError):
+                    continue
+                if isinstance(payload, dict) and payload.get("type") == "done":
+                    break
+        except ConnectionClosedOK:
+            pass
+        finally:
+            # Once the server is done (or gone) there is nobody left to send to.
+            send_task.cancel()
+
+    @staticmethod
+    async def _send_text(websocket: WebSocketClientProtocol, texts: List[str]):
+        # Chunks keep their original whitespace and may split a word, so they
+        # are concatenated as-is.
+        await websocket.send(_dumps({"type": "text", "text": "".join(texts)}))
 
     async def synthesize_burst(self, text: str) -> AsyncIterator[bytes]:
         """Synthesize a single text chunk (useful for dev/burst mode)."""